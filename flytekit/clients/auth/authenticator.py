@@ -318,6 +318,7 @@ class DeviceCodeAuthenticator(Authenticator):
                 scopes=self._scopes,
                 http_proxy_url=self._http_proxy_url,
                 verify=self._verify,
+                session=self._session,
             )
             self._creds = Credentials(access_token=token, expires_in=expires_in, for_endpoint=self._endpoint)
             KeyringStore.store(self._creds)
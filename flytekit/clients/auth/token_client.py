@@ -18,6 +18,13 @@ utf_8 = "utf-8"
 error_slow_down = "slow_down"
 error_auth_pending = "authorization_pending"
 
+# Headers sent with every request to the token endpoint
+_token_request_headers = {
+    "Cache-Control": "no-cache",
+    "Accept": "application/json",
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
 
 # Grant Types
 class GrantType(str, enum.Enum):
@@ -63,9 +70,8 @@ def get_basic_authorization_header(client_id: str, client_secret: str) -> str:
     :param client_secret: str
     :rtype: str
     """
-    encoded = urllib.parse.quote_plus(client_secret)
-    concatenated = "{}:{}".format(client_id, encoded)
-    return "Basic {}".format(base64.b64encode(concatenated.encode(utf_8)).decode(utf_8))
+    credentials = f"{client_id}:{urllib.parse.quote_plus(client_secret)}".encode(utf_8)
+    return "Basic " + base64.b64encode(credentials).decode("ascii")
 
 
 def get_token(
@@ -84,11 +90,7 @@ def get_token(
     :rtype: (Text,Int) The first element is the access token retrieved from the IDP, the second is the expiration
             in seconds
     """
-    headers = {
-        "Cache-Control": "no-cache",
-        "Accept": "application/json",
-        "Content-Type": "application/x-www-form-urlencoded",
-    }
+    headers = _token_request_headers.copy()
     if authorization_header:
         headers["Authorization"] = authorization_header
     body = {
@@ -154,6 +156,7 @@ def poll_token_endpoint(
     scopes: typing.Optional[str] = None,
     http_proxy_url: typing.Optional[str] = None,
     verify: typing.Optional[typing.Union[bool, str]] = None,
+    session: typing.Optional[requests.Session] = None,
 ) -> typing.Tuple[str, int]:
     tick = datetime.now()
     interval = timedelta(seconds=resp.interval)
@@ -169,6 +172,7 @@ def poll_token_endpoint(
                 device_code=resp.device_code,
                 http_proxy_url=http_proxy_url,
                 verify=verify,
+                session=session,
             )
             print("Authentication successful!")
             return access_token, expires_in
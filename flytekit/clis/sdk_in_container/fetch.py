@@ -11,6 +11,9 @@ from flytekit.core.type_engine import LiteralsResolver
 from flytekit.interaction.string_literals import literal_map_string_repr, literal_string_repr
 from flytekit.remote import FlyteRemote
 
+# Above this many characters, fetched data is echoed as is instead of pretty printed when it is also being downloaded
+MAX_PRETTY_PRINT_LENGTH = 4096
+
 
 @click.command("fetch")
 @click.option(
@@ -41,8 +44,11 @@ def fetch(ctx: click.Context, recursive: bool, flyte_data_uri: str, download_to:
         p = literal_map_string_repr(data.literals)
     else:
         p = data
-    pretty = Pretty(p)
-    panel = Panel(pretty)
-    print(panel)
+    plain = str(p) if download_to else None
+    if plain is not None and len(plain) > MAX_PRETTY_PRINT_LENGTH:
+        # Pretty printing walks every value and is slow for large payloads, which are not the point when downloading
+        click.echo(plain)
+    else:
+        print(Panel(Pretty(p)))
     if download_to:
         remote.download(data, download_to, recursive=recursive)
@@ -1,48 +1,94 @@
-from typing import Optional, Tuple
+import os
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
-from diskcache import Cache
+from diskcache import UNKNOWN, Cache, Disk, FanoutCache
+from flyteidl.core import literals_pb2
 
 from flytekit import lazy_module
 from flytekit.models.literals import Literal, LiteralCollection, LiteralMap
 
-joblib = lazy_module("joblib")
+xxhash = lazy_module("xxhash")
 
 # Location on the filesystem where serialized objects will be stored
 # TODO: read from config
 CACHE_LOCATION = "~/.flyte/local-cache"
+# Number of shards the cache is split into, which keeps the number of entries per directory bounded
+CACHE_SHARDS = 16
+# Database of the unsharded cache that older versions stored at the root of the cache location
+LEGACY_CACHE_DB = "cache.db"
+
+# Number of recently computed cache keys kept in memory, so that a `get` followed by a `set` for the same inputs
+# only hashes them once
+CACHE_KEY_MEMO_SIZE = 128
 
 
 def _recursive_hash_placement(literal: Literal) -> Literal:
-    # Base case, hash gets passed through always if set
-    if literal.hash is not None:
-        return Literal(hash=literal.hash)
-    elif literal.collection is not None:
-        literals = [_recursive_hash_placement(lit) for lit in literal.collection.literals]
-        return Literal(collection=LiteralCollection(literals=literals))
-    elif literal.map is not None:
-        literal_map = {}
-        for key, literal_value in literal.map.literals.items():
-            literal_map[key] = _recursive_hash_placement(literal_value)
-        return Literal(map=LiteralMap(literal_map))
-    else:
-        return literal
+    """
+    Replaces every literal in the tree that carries a hash with a literal containing only that hash. Subtrees without
+    any hash are returned as is, so a literal without hashes is not copied at all.
+    """
+    # Post-order walk with an explicit stack, recording the replacement for every node whose subtree contains a hash
+    replacements: Dict[int, Literal] = {}
+    stack: List[Tuple[Literal, bool]] = [(literal, False)]
+    while stack:
+        node, children_visited = stack.pop()
+        # Base case, hash gets passed through always if set
+        if node.hash is not None:
+            replacements[id(node)] = Literal(hash=node.hash)
+        elif node.collection is not None:
+            if not children_visited:
+                stack.append((node, True))
+                stack.extend((lit, False) for lit in node.collection.literals)
+            elif any(id(lit) in replacements for lit in node.collection.literals):
+                literals = [replacements.get(id(lit), lit) for lit in node.collection.literals]
+                replacements[id(node)] = Literal(collection=LiteralCollection(literals=literals))
+        elif node.map is not None:
+            if not children_visited:
+                stack.append((node, True))
+                stack.extend((lit, False) for lit in node.map.literals.values())
+            elif any(id(lit) in replacements for lit in node.map.literals.values()):
+                literal_map = {key: replacements.get(id(lit), lit) for key, lit in node.map.literals.items()}
+                replacements[id(node)] = Literal(map=LiteralMap(literal_map))
+    return replacements.get(id(literal), literal)
 
 
 def _calculate_cache_key(
     task_name: str, cache_version: str, input_literal_map: LiteralMap, cache_ignore_input_vars: Tuple[str, ...] = ()
 ) -> str:
+    literals = {k: v for k, v in input_literal_map.literals.items() if k not in cache_ignore_input_vars}
+
+    # If every input already carries a hash there is nothing to traverse or serialize, the hashes can be combined as is
+    if literals and all(literal.hash is not None for literal in literals.values()):
+        hashed_inputs = "\0".join(sorted(f"{key}={literal.hash}" for key, literal in literals.items())).encode()
+        return f"{task_name}-{cache_version}-{xxhash.xxh3_128_hexdigest(hashed_inputs)}"
+
     # Traverse the literals and replace the literal with a new literal that only contains the hash
     literal_map_overridden = {}
-    for key, literal in input_literal_map.literals.items():
-        if key in cache_ignore_input_vars:
-            continue
+    for key, literal in literals.items():
         literal_map_overridden[key] = _recursive_hash_placement(literal)
 
     # Generate a stable representation of the underlying protobuf by passing `deterministic=True` to the
     # protobuf library.
     hashed_inputs = LiteralMap(literal_map_overridden).to_flyte_idl().SerializeToString(deterministic=True)
-    # Use joblib to hash the string representation of the literal into a fixed length string
-    return f"{task_name}-{cache_version}-{joblib.hash(hashed_inputs)}"
+    # Hash the serialized bytes directly into a fixed length string. A non-cryptographic hash is enough here since
+    # the key is already namespaced by task name and cache version.
+    return f"{task_name}-{cache_version}-{xxhash.xxh3_128_hexdigest(hashed_inputs)}"
+
+
+class LiteralMapDisk(Disk):
+    """
+    Serializes cached LiteralMaps as protobuf bytes rather than pickling the model objects, which is both faster and
+    more compact. Only LiteralMaps can be stored in a cache using this disk.
+    """
+
+    def store(self, value: LiteralMap, read, key=UNKNOWN):
+        return super().store(value.to_flyte_idl().SerializeToString(), read, key=key)
+
+    def fetch(self, mode, filename, value, read) -> LiteralMap:
+        data = super().fetch(mode, filename, value, read)
+        return LiteralMap.from_flyte_idl(literals_pb2.LiteralMap.FromString(data))
 
 
 class LocalTaskCache(object):
@@ -50,12 +96,31 @@ class LocalTaskCache(object):
     This class implements a persistent store able to cache the result of local task executions.
     """
 
-    _cache: Cache
+    _cache: FanoutCache
     _initialized: bool = False
+    # (id(input_literal_map), task_name, cache_version, cache_ignore_input_vars) -> (weakref to the map, cache key)
+    _keys: "OrderedDict[tuple, Tuple[weakref.ref, str]]" = OrderedDict()
+
+    @staticmethod
+    def _get_cache_key(
+        task_name: str, cache_version: str, input_literal_map: LiteralMap, cache_ignore_input_vars: Tuple[str, ...]
+    ) -> str:
+        memo_key = (id(input_literal_map), task_name, cache_version, tuple(cache_ignore_input_vars))
+        entry = LocalTaskCache._keys.get(memo_key)
+        # Ids can be reused once an object is garbage collected, so make sure the entry still refers to the same map
+        if entry is not None and entry[0]() is input_literal_map:
+            LocalTaskCache._keys.move_to_end(memo_key)
+            return entry[1]
+
+        key = _calculate_cache_key(task_name, cache_version, input_literal_map, cache_ignore_input_vars)
+        LocalTaskCache._keys[memo_key] = (weakref.ref(input_literal_map), key)
+        if len(LocalTaskCache._keys) > CACHE_KEY_MEMO_SIZE:
+            LocalTaskCache._keys.popitem(last=False)
+        return key
 
     @staticmethod
     def initialize():
-        LocalTaskCache._cache = Cache(CACHE_LOCATION)
+        LocalTaskCache._cache = FanoutCache(CACHE_LOCATION, shards=CACHE_SHARDS, timeout=1, disk=LiteralMapDisk)
         LocalTaskCache._initialized = True
 
     @staticmethod
@@ -63,6 +128,19 @@ class LocalTaskCache(object):
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
         LocalTaskCache._cache.clear()
+        LocalTaskCache._clear_legacy_cache()
+
+    @staticmethod
+    def _clear_legacy_cache():
+        # Entries written before the cache was sharded are never read any more, so remove them along with their database
+        legacy_db = os.path.join(os.path.expanduser(CACHE_LOCATION), LEGACY_CACHE_DB)
+        if not os.path.exists(legacy_db):
+            return
+        with Cache(CACHE_LOCATION) as legacy_cache:
+            legacy_cache.clear()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(legacy_db + suffix):
+                os.remove(legacy_db + suffix)
 
     @staticmethod
     def get(
@@ -71,7 +149,7 @@ class LocalTaskCache(object):
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
         return LocalTaskCache._cache.get(
-            _calculate_cache_key(task_name, cache_version, input_literal_map, cache_ignore_input_vars)
+            LocalTaskCache._get_cache_key(task_name, cache_version, input_literal_map, cache_ignore_input_vars)
         )
 
     @staticmethod
@@ -85,5 +163,5 @@ class LocalTaskCache(object):
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
         LocalTaskCache._cache.set(
-            _calculate_cache_key(task_name, cache_version, input_literal_map, cache_ignore_input_vars), value
+            LocalTaskCache._get_cache_key(task_name, cache_version, input_literal_map, cache_ignore_input_vars), value
         )
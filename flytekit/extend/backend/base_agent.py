@@ -2,7 +2,6 @@ import asyncio
 import json
 import signal
 import sys
-import time
 import typing
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -35,6 +34,10 @@ from flytekit.models import common
 from flytekit.models.literals import LiteralMap
 from flytekit.models.task import TaskExecutionMetadata, TaskTemplate
 
+# Bounds, in seconds, of the interval between two status checks when running an async agent task locally
+INITIAL_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 5.0
+
 
 class TaskCategory:
     def __init__(self, name: str, version: int = 0):
@@ -331,10 +334,9 @@ class AsyncAgentExecutorMixin:
         task_template = get_serializable(OrderedDict(), ss, self).template
         self._agent = AgentRegistry.get_agent(task_template.type, task_template.task_type_version)
 
-        resource_mata = asyncio.run(
-            self._create(task_template=task_template, output_prefix=output_prefix, inputs=kwargs)
+        resource = asyncio.run(
+            self._run(ctx=ctx, task_template=task_template, output_prefix=output_prefix, inputs=kwargs)
         )
-        resource = asyncio.run(self._get(resource_meta=resource_mata))
 
         if resource.phase != TaskExecution.SUCCEEDED:
             raise FlyteUserException(f"Failed to run the task {self.name} with error: {resource.message}")
@@ -351,10 +353,27 @@ class AsyncAgentExecutorMixin:
 
         return resource.outputs
 
+    async def _run(
+        self: PythonTask,
+        ctx: FlyteContext,
+        task_template: TaskTemplate,
+        output_prefix: str,
+        inputs: Dict[str, Any] = None,
+    ) -> Resource:
+        # Create and poll the task within a single event loop, so the clean up task scheduled by the signal handler
+        # runs on the same loop as the polling
+        resource_meta = await self._create(
+            ctx=ctx, task_template=task_template, output_prefix=output_prefix, inputs=inputs
+        )
+        return await self._get(resource_meta=resource_meta)
+
     async def _create(
-        self: PythonTask, task_template: TaskTemplate, output_prefix: str, inputs: Dict[str, Any] = None
+        self: PythonTask,
+        ctx: FlyteContext,
+        task_template: TaskTemplate,
+        output_prefix: str,
+        inputs: Dict[str, Any] = None,
     ) -> ResourceMeta:
-        ctx = FlyteContext.current_context()
         if isinstance(self, PythonFunctionTask):
             es = ctx.new_execution_state().with_params(mode=ExecutionState.Mode.TASK_EXECUTION)
             cb = ctx.new_builder().with_execution_state(es)
@@ -387,10 +406,13 @@ class AsyncAgentExecutorMixin:
         task = progress.add_task(f"[cyan]Running Task {self.name}...", total=None)
         task_phase = progress.add_task("[cyan]Task phase: RUNNING, Phase message: ", total=None, visible=False)
         task_log_links = progress.add_task("[cyan]Log Links: ", total=None, visible=False)
+        # Poll quickly at first so short tasks finish promptly, then back off to avoid hammering the agent
+        poll_interval = INITIAL_POLL_INTERVAL
         with progress:
             while not is_terminal_phase(phase):
                 progress.start_task(task)
-                time.sleep(1)
+                await asyncio.sleep(poll_interval)
+                poll_interval = min(poll_interval * 1.5, MAX_POLL_INTERVAL)
                 resource = await mirror_async_methods(self._agent.get, resource_meta=resource_meta)
                 if self._clean_up_task:
                     await self._clean_up_task
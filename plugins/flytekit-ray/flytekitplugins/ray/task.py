@@ -1,4 +1,5 @@
 import base64
+import copy
 import json
 import os
 import typing
@@ -63,6 +64,9 @@ class RayFunctionTask(PythonFunctionTask):
             **kwargs,
         )
         self._task_config = task_config
+        # The custom section only depends on the task config, so it is computed once and reused across serializations.
+        # This means the task config must not be mutated after the task is constructed.
+        self._custom: Optional[Dict[str, Any]] = None
 
     def pre_execute(self, user_params: ExecutionParameters) -> ExecutionParameters:
         init_params = {"address": self._task_config.address}
@@ -79,12 +83,20 @@ class RayFunctionTask(PythonFunctionTask):
         return user_params
 
     def get_custom(self, settings: SerializationSettings) -> Optional[Dict[str, Any]]:
+        if self._custom is None:
+            self._custom = self._build_custom()
+        # Callers get their own copy, so modifying the returned dict does not affect later serializations
+        return copy.deepcopy(self._custom)
+
+    def _build_custom(self) -> Dict[str, Any]:
         cfg = self._task_config
 
         # Deprecated: runtime_env is removed KubeRay >= 1.1.0. It is replaced by runtime_env_yaml
         runtime_env = base64.b64encode(json.dumps(cfg.runtime_env).encode()).decode() if cfg.runtime_env else None
 
-        runtime_env_yaml = yaml.dump(cfg.runtime_env) if cfg.runtime_env else None
+        # Prefer the libyaml backed dumper when PyYAML was built with it, it is much faster than the pure python one
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        runtime_env_yaml = yaml.dump(cfg.runtime_env, Dumper=dumper) if cfg.runtime_env else None
 
         ray_job = RayJob(
             ray_cluster=RayCluster(
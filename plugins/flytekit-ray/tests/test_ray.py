@@ -48,6 +48,11 @@ def test_ray_task():
         ttl_seconds_after_finished=20,
     ).to_flyte_idl()
 
+    assert t1.get_custom(settings) == MessageToDict(ray_job_pb)
+    # Repeated serializations return the same value, unaffected by changes callers make to a previous result
+    custom = t1.get_custom(settings)
+    custom["rayCluster"]["workerGroupSpec"].clear()
+    custom.clear()
     assert t1.get_custom(settings) == MessageToDict(ray_job_pb)
 
     assert t1.get_command(settings) == [
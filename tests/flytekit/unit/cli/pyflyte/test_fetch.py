@@ -0,0 +1,34 @@
+import pytest
+from click.testing import CliRunner
+from mock import mock
+
+from flytekit.clis.sdk_in_container import pyflyte
+from flytekit.remote import FlyteRemote
+
+
+@mock.patch("flytekit.configuration.plugin.FlyteRemote", spec=FlyteRemote)
+@pytest.mark.parametrize(
+    ("size", "download_to", "pretty"),
+    [
+        (10, None, True),
+        (10_000, None, True),
+        (10, "out", True),
+        (10_000, "out", False),
+    ],
+)
+def test_pyflyte_fetch(mock_remote, size, download_to, pretty):
+    remote = mock_remote.return_value
+    remote.get.return_value = {"o0": "x" * size}
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        args = ["fetch", "flyte://v1/flytesnacks/development/a/n0/o"] + ([download_to] if download_to else [])
+        result = runner.invoke(pyflyte.main, args)
+        assert result.exit_code == 0, result.output
+        # Only large payloads that are also being downloaded skip the pretty printed panel
+        assert ("╭" in result.output) is pretty
+        if not pretty:
+            assert str({"o0": "x" * size}) in result.output
+        if download_to:
+            remote.download.assert_called_once_with(remote.get.return_value, download_to, recursive=False)
+        else:
+            remote.download.assert_not_called()
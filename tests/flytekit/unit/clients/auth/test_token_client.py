@@ -84,3 +84,19 @@ def test_poll_token_endpoint(mock_session):
 
     assert t == "abc"
     assert e == 60
+
+
+@patch("flytekit.clients.auth.token_client.requests.Session")
+def test_poll_token_endpoint_uses_session(mock_session):
+    session = MagicMock()
+    response = MagicMock()
+    response.ok = True
+    response.json.return_value = {"access_token": "abc", "expires_in": 60}
+    session.post.return_value = response
+
+    r = DeviceCodeResponse(device_code="x", user_code="y", verification_uri="v", expires_in=1, interval=0)
+    t, e = poll_token_endpoint(r, "test.com", "test", session=session)
+
+    assert (t, e) == ("abc", 60)
+    session.post.assert_called_once()
+    mock_session.assert_not_called()
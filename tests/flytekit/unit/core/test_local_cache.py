@@ -7,6 +7,7 @@ from typing import Dict, List
 
 import pytest
 from dataclasses_json import DataClassJsonMixin
+from diskcache import Cache
 from pytest import fixture
 from typing_extensions import Annotated
 
@@ -16,7 +17,7 @@ from flytekit.core.base_task import kwtypes
 from flytekit.core.context_manager import FlyteContextManager
 from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.hash import HashMethod
-from flytekit.core.local_cache import LocalTaskCache, _calculate_cache_key, _recursive_hash_placement
+from flytekit.core.local_cache import LiteralMapDisk, LocalTaskCache, _calculate_cache_key, _recursive_hash_placement
 from flytekit.core.task import TaskMetadata, task
 from flytekit.core.testing import task_mock
 from flytekit.core.type_engine import TypeEngine
@@ -529,7 +530,17 @@ def test_stable_cache_key():
         }
     )
     key = _calculate_cache_key("task_name_1", "31415", lm)
-    assert key == "task_name_1-31415-e3a85f91467d1e1f721ebe8129b2de31"
+    assert key == "task_name_1-31415-91db149de96144c147a816e721db9a77"
+
+
+@pytest.mark.serial
+def test_cache_key_ignores_map_ordering():
+    a = Literal(scalar=Scalar(primitive=Primitive(integer=1)))
+    b = Literal(scalar=Scalar(primitive=Primitive(string_value="b")))
+
+    lm = LiteralMap(literals={"x": a, "y": Literal(map=LiteralMap(literals={"a": a, "b": b}))})
+    reordered = LiteralMap(literals={"y": Literal(map=LiteralMap(literals={"b": b, "a": a})), "x": a})
+    assert _calculate_cache_key("t1", "007", lm) == _calculate_cache_key("t1", "007", reordered)
 
 
 @pytest.mark.skipif("pandas" not in sys.modules, reason="Pandas is not installed.")
@@ -587,6 +598,104 @@ def test_literal_hash_placement():
     assert litcoll.hash == _recursive_hash_placement(litcoll).hash
 
 
+@pytest.mark.serial
+def test_literal_hash_placement_nested():
+    lit = Literal(scalar=Scalar(primitive=Primitive(string_value="test")))
+    hashed = Literal(scalar=Scalar(primitive=Primitive(string_value="big")), hash="0xffff")
+
+    # Literals without any hash are passed through without being copied
+    unhashed = Literal(map=LiteralMap(literals={"a": Literal(collection=LiteralCollection(literals=[lit]))}))
+    assert _recursive_hash_placement(unhashed) is unhashed
+
+    nested = Literal(
+        map=LiteralMap(
+            literals={
+                "a": Literal(collection=LiteralCollection(literals=[lit, hashed])),
+                "b": lit,
+            }
+        )
+    )
+    placed = _recursive_hash_placement(nested)
+    assert placed.map.literals["b"] is lit
+    assert placed.map.literals["a"].collection.literals[0] is lit
+    assert placed.map.literals["a"].collection.literals[1] == Literal(hash="0xffff")
+
+
+@pytest.mark.serial
+def test_cache_key_with_all_inputs_hashed():
+    lit = Literal(scalar=Scalar(primitive=Primitive(string_value="test")))
+
+    lm = LiteralMap(
+        literals={"a": Literal(scalar=lit.scalar, hash="0xffff"), "b": Literal(map=LiteralMap({}), hash="1")}
+    )
+    same = LiteralMap(literals={"b": Literal(hash="1"), "a": Literal(hash="0xffff")})
+    other = LiteralMap(literals={"a": Literal(scalar=lit.scalar, hash="0xfffe"), "b": Literal(hash="1")})
+
+    assert _calculate_cache_key("t1", "007", lm) == _calculate_cache_key("t1", "007", same)
+    assert _calculate_cache_key("t1", "007", lm) != _calculate_cache_key("t1", "007", other)
+    assert _calculate_cache_key("t1", "007", lm, ("a",)) == _calculate_cache_key("t1", "007", other, ("a",))
+
+    # Mixing hashed and unhashed inputs falls back to serializing the literals
+    mixed = LiteralMap(literals={"a": Literal(scalar=lit.scalar, hash="0xffff"), "b": lit})
+    assert _calculate_cache_key("t1", "007", mixed) != _calculate_cache_key("t1", "007", lm)
+
+
+@pytest.mark.serial
+def test_cache_key_is_computed_once_per_input_map(monkeypatch):
+    calls = []
+
+    def calculate_cache_key(*args):
+        calls.append(args)
+        return _calculate_cache_key(*args)
+
+    monkeypatch.setattr(flytekit.core.local_cache, "_calculate_cache_key", calculate_cache_key)
+    lm = LiteralMap(literals={"a": Literal(scalar=Scalar(primitive=Primitive(integer=1)))})
+    value = LiteralMap(literals={"o0": Literal(scalar=Scalar(primitive=Primitive(integer=2)))})
+
+    assert LocalTaskCache.get("t_memo", "v1", lm, ()) is None
+    LocalTaskCache.set("t_memo", "v1", lm, (), value)
+    assert LocalTaskCache.get("t_memo", "v1", lm, ()) == value
+    assert len(calls) == 1
+
+    # A different cache version for the same inputs is a different key
+    assert LocalTaskCache.get("t_memo", "v2", lm, ()) is None
+    assert len(calls) == 2
+
+
+def test_literal_map_disk(tmp_path):
+    lm = LiteralMap(literals={"o0": Literal(scalar=Scalar(primitive=Primitive(string_value="x" * 100_000)))})
+    small_lm = LiteralMap(literals={"o0": Literal(scalar=Scalar(primitive=Primitive(integer=2)))})
+
+    cache = Cache(str(tmp_path), disk=LiteralMapDisk)
+    cache.set("large", lm)
+    cache.set("small", small_lm)
+    assert cache.get("large") == lm
+    assert cache.get("small") == small_lm
+
+    # Values are stored as protobuf bytes, not pickles
+    assert Cache(str(tmp_path)).get("small") == small_lm.to_flyte_idl().SerializeToString()
+
+
+@pytest.mark.serial
+def test_clear_removes_legacy_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(flytekit.core.local_cache, "CACHE_LOCATION", str(tmp_path))
+    monkeypatch.setattr(LocalTaskCache, "_cache", None, raising=False)
+    monkeypatch.setattr(LocalTaskCache, "_initialized", False)
+
+    # Populate the unsharded cache older versions wrote to the root of the cache location
+    with Cache(str(tmp_path)) as legacy_cache:
+        legacy_cache.set("small", b"0")
+        legacy_cache.set("large", b"0" * 100_000)
+    assert (tmp_path / "cache.db").exists()
+
+    LocalTaskCache.clear()
+    assert not (tmp_path / "cache.db").exists()
+    assert not [p for p in tmp_path.rglob("*.val")]
+
+    # Clearing again once the legacy cache is gone is a no-op
+    LocalTaskCache.clear()
+
+
 @task(cache=True, cache_version="v0")
 def t2(n: int) -> int:
     ctx = flytekit.current_context()